@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+import asyncio
+from typing import Iterator
+
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 from pydantic import BaseModel
 
 from dna_translation_motif_finder import (
+    check_frame,
     find_motifs,
     normalize_dna,
     reverse_complement,
+    translate_chunks,
     translate_dna,
 )
 
@@ -18,6 +24,17 @@ app = FastAPI(title="DNA Translation and Motif Finder")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
+# Sequences shorter than this are analyzed on the event loop; the thread hop
+# would cost more than the work itself.
+INLINE_SEQUENCE_LIMIT = 4096
+
+# Sequences longer than this are streamed back as chunked JSON, translating one
+# chunk at a time so the full protein string and response body are never built.
+# translate_chunks picks the backend from the whole sequence length, so
+# sequences of NUMBA_MIN_LENGTH bases or more still use the numba kernel.
+STREAMING_SEQUENCE_LIMIT = 10**6
+STREAM_CHUNK_SIZE = 1 << 16
+
 
 class AnalyzeRequest(BaseModel):
     sequence: str
@@ -32,31 +49,80 @@ def index(request: Request) -> HTMLResponse:
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.post("/api/analyze")
-def analyze(payload: AnalyzeRequest) -> dict:
+@app.post("/api/analyze", response_class=ORJSONResponse)
+async def analyze(payload: AnalyzeRequest) -> Response:
+    if len(payload.sequence) < INLINE_SEQUENCE_LIMIT:
+        return run_analysis(payload)
+    return await asyncio.to_thread(run_analysis, payload)
+
+
+def run_analysis(payload: AnalyzeRequest) -> Response:
     try:
         sequence = normalize_dna(payload.sequence)
+        check_frame(payload.frame)
         if payload.reverse_complement:
             sequence = reverse_complement(sequence)
 
+        positions: list[int] = []
+        if payload.motif:
+            positions = list(find_motifs(sequence, payload.motif))
+
+        if len(sequence) > STREAMING_SEQUENCE_LIMIT:
+            protein_chunks = translate_chunks(
+                sequence=sequence,
+                frame=payload.frame,
+                stop_at_stop=payload.stop_at_stop,
+                chunk_size=STREAM_CHUNK_SIZE,
+            )
+            return StreamingResponse(
+                stream_analysis(sequence, protein_chunks, payload, positions),
+                media_type="application/json",
+            )
+
         protein = translate_dna(
             sequence=sequence,
             frame=payload.frame,
             stop_at_stop=payload.stop_at_stop,
         )
 
-        positions: list[int] = []
-        if payload.motif:
-            positions = list(find_motifs(sequence, payload.motif))
-
-        return {
+        result = {
             "dna": sequence,
             "protein": protein,
-            "frame": payload.frame,
-            "reverse_complement": payload.reverse_complement,
-            "stop_at_stop": payload.stop_at_stop,
-            "motif": payload.motif.upper() if payload.motif else None,
+            **analysis_options(payload),
             "motif_positions": positions,
         }
+        # Returning the response directly skips FastAPI's jsonable_encoder walk
+        # and serializes inside the worker thread for long sequences.
+        return ORJSONResponse(result)
     except ValueError as error:
         raise HTTPException(status_code=400, detail=str(error)) from error
+
+
+def analysis_options(payload: AnalyzeRequest) -> dict:
+    return {
+        "frame": payload.frame,
+        "reverse_complement": payload.reverse_complement,
+        "stop_at_stop": payload.stop_at_stop,
+        "motif": payload.motif.upper() if payload.motif else None,
+    }
+
+
+def stream_analysis(
+    sequence: str,
+    protein_chunks: Iterator[str],
+    payload: AnalyzeRequest,
+    positions: list[int],
+) -> Iterator[bytes]:
+    """Write the same JSON document as run_analysis, a chunk at a time.
+
+    DNA and protein strings only contain letters and "*", so their chunks can be
+    emitted without JSON escaping.
+    """
+    yield b'{"dna":"'
+    for offset in range(0, len(sequence), STREAM_CHUNK_SIZE):
+        yield sequence[offset : offset + STREAM_CHUNK_SIZE].encode("ascii")
+    yield b'","protein":"'
+    for chunk in protein_chunks:
+        yield chunk.encode("ascii")
+    tail = {**analysis_options(payload), "motif_positions": positions}
+    yield b'",' + orjson.dumps(tail)[1:]
@@ -4,10 +4,27 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import re
 import sys
 from dataclasses import dataclass
-from typing import List, Sequence
+from typing import Callable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the CLI falls back to pure Python.
+    np = None
+
+try:
+    import numba
+except ImportError:  # numba is optional; long sequences use the NumPy path.
+    numba = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; motifs fall back to regex.
+    ahocorasick = None
 
 CODON_TABLE = {
     "TTT": "F", "TTC": "F", "TTA": "L", "TTG": "L",
@@ -46,6 +63,61 @@ IUPAC_TO_REGEX = {
     "N": "[ACGT]",
 }
 
+IUPAC_SETS = {code: pattern.strip("[]") for code, pattern in IUPAC_TO_REGEX.items()}
+
+# str.translate tables for motif_to_regex: one expands each IUPAC code to its
+# regex fragment, the other deletes valid codes to expose unsupported symbols.
+_IUPAC_REGEX_TABLE = str.maketrans(IUPAC_TO_REGEX)
+_IUPAC_DELETE_TABLE = str.maketrans("", "", "".join(IUPAC_TO_REGEX))
+
+# CODON_TABLE as a perfect hash: codon (b0, b1, b2) packs to the 6-bit index
+# b0 << 4 | b1 << 2 | b2 with A=0, C=1, G=2, T=3.
+BASE_TO_2BIT = {"A": 0, "C": 1, "G": 2, "T": 3}
+CODON64 = bytearray(64)
+for _codon, _aa in CODON_TABLE.items():
+    CODON64[(BASE_TO_2BIT[_codon[0]] << 4) | (BASE_TO_2BIT[_codon[1]] << 2) | BASE_TO_2BIT[_codon[2]]] = ord(_aa)
+CODON64 = bytes(CODON64)
+
+# Per-position byte -> shifted 2-bit tables for the pure-Python loop. N sets
+# bit 6, which lands in the upper half of _CODON128 and translates to X.
+_CODON128 = CODON64 + b"X" * 64
+_CODON_POSITION_TABLES = []
+for _shift in (4, 2, 0):
+    _table = bytearray(256)
+    for _base, _bits in BASE_TO_2BIT.items():
+        _table[ord(_base)] = _bits << _shift
+    _table[ord("N")] = 64
+    _CODON_POSITION_TABLES.append(bytes(_table))
+
+# Sequences at least this long are translated with NumPy if available; below
+# it, array setup costs more than the pure-Python loop.
+NUMPY_MIN_LENGTH = 512
+
+# Sequences at least this long are translated by the numba kernel if available.
+NUMBA_MIN_LENGTH = 1 << 20
+
+# bytes.translate table for normalize_dna: valid bases (either case) map to
+# uppercase, anything else maps to _INVALID_BYTE. Whitespace is deleted.
+_INVALID_BYTE = 0xFF
+_ASCII_WHITESPACE = b" \t\n\r\v\f\x1c\x1d\x1e\x1f"
+_NORMALIZE_TABLE = bytearray([_INVALID_BYTE]) * 256
+for _base in b"ACGTN":
+    _NORMALIZE_TABLE[_base] = _base
+    _NORMALIZE_TABLE[_base + 32] = _base
+_NORMALIZE_TABLE = bytes(_NORMALIZE_TABLE)
+
+_COMPLEMENT_TABLE = str.maketrans("ACGTN", "TGCAN")
+
+# Motifs expanding to more concrete strings than this are scanned with regex;
+# beyond it, building the automaton costs more than a typical regex scan.
+MAX_MOTIF_EXPANSION = 256
+
+if np is not None:
+    # Array forms of BASE_TO_2BIT (indexed by ASCII byte) and CODON64.
+    BASE_TO_IDX = np.zeros(256, dtype=np.uint8)
+    BASE_TO_IDX[list(b"ACGT")] = [0, 1, 2, 3]
+    CODON_LUT = np.frombuffer(CODON64, dtype=np.uint8)
+
 
 @dataclass
 class InteractiveOptions:
@@ -56,54 +128,217 @@ class InteractiveOptions:
     motif: str | None = None
 
 
-def normalize_dna(sequence: str) -> str:
-    sequence = "".join(sequence.split()).upper()
+class NormalizedDNA(str):
+    """A sequence already cleaned by normalize_dna, so it is not re-scanned."""
+
+    __slots__ = ()
+
+
+def normalize_dna(sequence: str) -> NormalizedDNA:
+    if isinstance(sequence, NormalizedDNA):
+        return sequence
+
+    try:
+        raw = sequence.encode("ascii")
+    except UnicodeEncodeError:
+        # Non-ASCII input (e.g. Unicode whitespace) takes the slow path.
+        sequence = "".join(sequence.split()).upper()
+        _raise_invalid_bases(sequence)
+        return NormalizedDNA(sequence)
+
+    normalized = raw.translate(_NORMALIZE_TABLE, _ASCII_WHITESPACE)
+    if _INVALID_BYTE in normalized:
+        _raise_invalid_bases(raw.translate(None, _ASCII_WHITESPACE).upper().decode("ascii"))
+    return NormalizedDNA(normalized.decode("ascii"))
+
+
+def _raise_invalid_bases(sequence: str) -> None:
     invalid = sorted({base for base in sequence if base not in {"A", "C", "G", "T", "N"}})
     if invalid:
         raise ValueError(f"DNA contains invalid bases: {', '.join(invalid)}")
-    return sequence
 
 
 def reverse_complement(sequence: str) -> str:
-    table = str.maketrans("ACGTN", "TGCAN")
-    return sequence.translate(table)[::-1]
+    result = sequence.translate(_COMPLEMENT_TABLE)[::-1]
+    if isinstance(sequence, NormalizedDNA):
+        return NormalizedDNA(result)
+    return result
+
+
+def translate_chunks(
+    sequence: str, frame: int = 1, stop_at_stop: bool = False, chunk_size: int = 1 << 16
+) -> Iterator[str]:
+    """Translate a sequence piecewise, yielding the protein for each chunk of bases.
+
+    Chunks are cut on codon boundaries, so joining the pieces gives the same
+    result as translate_dna. The backend is picked from the length of the whole
+    sequence, not the chunk. Arguments are validated before iteration starts.
+    """
+    check_frame(frame)
+    sequence = normalize_dna(sequence)
+    translate = _select_backend(len(sequence))
+    step = max(3, chunk_size - chunk_size % 3)
+    return _iter_translation(sequence, frame - 1, stop_at_stop, step, translate)
+
+
+def _iter_translation(
+    sequence: NormalizedDNA,
+    start: int,
+    stop_at_stop: bool,
+    step: int,
+    translate: Callable[[str, int], bytes],
+) -> Iterator[str]:
+    for offset in range(start, len(sequence), step):
+        protein = translate(sequence[offset : offset + step], 0)
+        if stop_at_stop:
+            stop = protein.find(b"*")
+            if stop >= 0:
+                if stop:
+                    yield protein[:stop].decode("ascii")
+                return
+        if protein:
+            yield protein.decode("ascii")
+
+
+def check_frame(frame: int) -> None:
+    if frame not in {1, 2, 3}:
+        raise ValueError("Frame must be 1, 2, or 3.")
 
 
 def translate_dna(sequence: str, frame: int = 1, stop_at_stop: bool = False) -> str:
-    if frame not in {1, 2, 3}:
-        raise ValueError("Frame must be 1, 2, or 3.")
+    check_frame(frame)
 
     sequence = normalize_dna(sequence)
-    start = frame - 1
-    amino_acids: List[str] = []
+    protein = _select_backend(len(sequence))(sequence, frame - 1)
+
+    # Translating everything and truncating keeps the backend loops branch-free;
+    # the stop search is a single C-level scan.
+    if stop_at_stop:
+        stop = protein.find(b"*")
+        if stop >= 0:
+            protein = protein[:stop]
+
+    return protein.decode("ascii")
+
+
+def _select_backend(length: int) -> Callable[[str, int], bytes]:
+    if numba is not None and length >= NUMBA_MIN_LENGTH:
+        return _translate_numba
+    if np is not None and length >= NUMPY_MIN_LENGTH:
+        return _translate_numpy
+    return _translate_python
 
-    for i in range(start, len(sequence) - 2, 3):
-        codon = sequence[i : i + 3]
-        aa = CODON_TABLE.get(codon, "X")
-        if stop_at_stop and aa == "*":
-            break
-        amino_acids.append(aa)
 
-    return "".join(amino_acids)
+def _translate_python(sequence: str, start: int) -> bytearray:
+    """Translate an already-normalized sequence one codon at a time."""
+    raw = sequence.encode("ascii")
+    first, second, third = _CODON_POSITION_TABLES
+    out = bytearray(max(0, (len(raw) - start) // 3))
+    k = 0
+
+    # Strided slices bake the frame offset in, leaving no index arithmetic in
+    # the loop; zip stops at the last complete codon.
+    for b0, b1, b2 in zip(raw[start::3], raw[start + 1 :: 3], raw[start + 2 :: 3]):
+        out[k] = _CODON128[first[b0] | second[b1] | third[b2]]
+        k += 1
+
+    return out
+
+
+def _translate_numpy(sequence: str, start: int) -> bytes:
+    """Vectorized translation of an already-normalized sequence."""
+    codon_count = max(0, (len(sequence) - start) // 3)
+    if codon_count == 0:
+        return b""
+
+    raw = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    raw = raw[start : start + 3 * codon_count].reshape(codon_count, 3)
+    bases = BASE_TO_IDX.take(raw)
+    idx = (bases[:, 0] << 4) | (bases[:, 1] << 2) | bases[:, 2]
+    protein = CODON_LUT.take(idx)
+    protein[(raw == ord("N")).any(axis=1)] = ord("X")
+    return protein.tobytes()
+
+
+if numba is not None:
+    # Array forms of the per-position tables and _CODON128, so the kernel
+    # resolves every codon, N included, with one branchless lookup.
+    _KERNEL_POSITION_LUTS = tuple(np.frombuffer(table, dtype=np.uint8) for table in _CODON_POSITION_TABLES)
+    _KERNEL_CODON_LUT = np.frombuffer(_CODON128, dtype=np.uint8)
+
+    @numba.njit(cache=True, boundscheck=False, nogil=True)
+    def _translate_kernel(buf, start, out, first, second, third, codon_lut):
+        for k in range(out.size):
+            i = start + 3 * k
+            out[k] = codon_lut[first[buf[i]] | second[buf[i + 1]] | third[buf[i + 2]]]
+
+
+def _translate_numba(sequence: str, start: int) -> bytes:
+    """Single fused pass over an already-normalized sequence."""
+    buf = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    out = np.empty(max(0, (buf.size - start) // 3), dtype=np.uint8)
+    _translate_kernel(buf, start, out, *_KERNEL_POSITION_LUTS, _KERNEL_CODON_LUT)
+    return out.tobytes()
 
 
 def motif_to_regex(motif: str) -> str:
     motif = motif.upper().strip()
+    _check_motif(motif)
+    return motif.translate(_IUPAC_REGEX_TABLE)
+
+
+def _check_motif(motif: str) -> None:
     if not motif:
         raise ValueError("Motif cannot be empty.")
 
-    try:
-        return "".join(IUPAC_TO_REGEX[char] for char in motif)
-    except KeyError as exc:
-        raise ValueError(f"Unsupported motif symbol: {exc.args[0]}") from exc
+    unsupported = motif.translate(_IUPAC_DELETE_TABLE)
+    if unsupported:
+        raise ValueError(f"Unsupported motif symbol: {unsupported[0]}")
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_motif(motif: str) -> re.Pattern[str]:
+    """Compile an overlapping-match regex for a normalized motif."""
+    return re.compile(f"(?=({motif_to_regex(motif)}))")
+
+
+def motif_expansion(motif: str) -> int:
+    """Return how many concrete sequences an IUPAC motif stands for."""
+    count = 1
+    for char in motif:
+        count *= len(IUPAC_SETS[char])
+    return count
+
+
+@functools.lru_cache(maxsize=128)
+def build_motif_automaton(motif: str) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton matching every expansion of a motif."""
+    automaton = ahocorasick.Automaton()
+    for bases in itertools.product(*(IUPAC_SETS[char] for char in motif)):
+        automaton.add_word("".join(bases), True)
+    automaton.make_automaton()
+    return automaton
 
 
 def find_motifs(sequence: str, motif: str) -> Sequence[int]:
     sequence = normalize_dna(sequence)
-    regex = motif_to_regex(motif)
-
-    pattern = re.compile(f"(?=({regex}))")
-    return [match.start() for match in pattern.finditer(sequence)]
+    motif = motif.upper().strip()
+    _check_motif(motif)
+    expansion = motif_expansion(motif)
+
+    if expansion == 1:
+        positions = []
+        position = sequence.find(motif)
+        while position >= 0:
+            positions.append(position)
+            position = sequence.find(motif, position + 1)
+        return positions
+
+    if ahocorasick is not None and expansion <= MAX_MOTIF_EXPANSION:
+        automaton = build_motif_automaton(motif)
+        return [end - len(motif) + 1 for end, _ in automaton.iter(sequence)]
+
+    return [match.start() for match in compile_motif(motif).finditer(sequence)]
 
 
 def prompt_for_sequence() -> str | None:
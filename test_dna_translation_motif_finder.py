@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+import dna_translation_motif_finder as finder
+
+SEQUENCES = [
+    "",
+    "A",
+    "AT",
+    "ATG",
+    "ATGAAATGA",
+    "NNN",
+    "ATGNCCTAGGN",
+    "TTTTAATAGTGAGGGCCCAAAN",
+    "ACGTN" * 41,
+]
+
+BACKENDS = [
+    pytest.param(finder._translate_python, id="python"),
+    pytest.param(
+        finder._translate_numpy,
+        id="numpy",
+        marks=pytest.mark.skipif(finder.np is None, reason="numpy not installed"),
+    ),
+    pytest.param(
+        finder._translate_numba,
+        id="numba",
+        marks=pytest.mark.skipif(finder.numba is None, reason="numba not installed"),
+    ),
+]
+
+
+def reference_translation(sequence: str, start: int) -> str:
+    codons = (sequence[i : i + 3] for i in range(start, len(sequence) - 2, 3))
+    return "".join(finder.CODON_TABLE.get(codon, "X") for codon in codons)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("sequence", SEQUENCES)
+@pytest.mark.parametrize("frame", [1, 2, 3])
+def test_translation_backends_match_codon_table(backend, sequence, frame):
+    sequence = finder.normalize_dna(sequence)
+    protein = bytes(backend(sequence, frame - 1)).decode("ascii")
+    assert protein == reference_translation(sequence, frame - 1)
+
+
+MOTIF_SEQUENCE = "AAAAGGCGTTAGGNGGTACCAAGGAATTGCN"
+MOTIFS = ["A", "AA", "GG", "GGN", "AAR", "NNN", "NNNNNN", "RYKMSWBDHV", "ACGTACGTACGTACGTACGTACGTACGTACGTACGT"]
+
+
+# Unambiguous motifs always take the str.find path; ambiguous ones take the
+# strategy configured below.
+def configure_regex(monkeypatch):
+    monkeypatch.setattr(finder, "ahocorasick", None)
+
+
+def configure_aho_corasick(monkeypatch):
+    if finder.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(finder, "MAX_MOTIF_EXPANSION", 10**6)
+
+
+@pytest.mark.parametrize("configure", [configure_regex, configure_aho_corasick], ids=["regex", "aho-corasick"])
+@pytest.mark.parametrize("motif", MOTIFS)
+def test_motif_strategies_match_regex_reference(monkeypatch, configure, motif):
+    configure(monkeypatch)
+    pattern = f"(?=({finder.motif_to_regex(motif)}))"
+    expected = [match.start() for match in re.finditer(pattern, MOTIF_SEQUENCE)]
+    assert list(finder.find_motifs(MOTIF_SEQUENCE, motif)) == expected